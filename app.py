@@ -16,16 +16,30 @@ Config expectations (config.json):
 """
 from __future__ import annotations
 
+import functools
+import hashlib
 import json
 import os
 import re
 import logging
 from typing import Optional
 
-from flask import Flask, render_template, jsonify, request, session
+from flask import Flask, Response, render_template, jsonify, request, session, stream_with_context
 from flask_cors import CORS
-import xml.etree.ElementTree as ET
+import orjson
+try:
+    from lxml import etree as ET
+    _HAS_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    _HAS_LXML = False
+try:
+    import re2 as re_fast
+except ImportError:
+    re_fast = re
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # We provide a server-side proxy endpoint `/api/proxy_chat` so the browser
 # doesn't have to call Ollama directly (avoids CORS and connectivity issues).
@@ -38,21 +52,79 @@ DATA_FILE = os.path.join(BASE_DIR, 'data', 'people.xml')
 logging.basicConfig(level=logging.INFO)
 log = logging.getLogger('dating-backend')
 
+
+class ORJSONProvider(Flask.json_provider_class):
+    """Serialize `jsonify` responses with orjson."""
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 app = Flask(__name__, static_folder='static', template_folder='templates')
+app.json = ORJSONProvider(app)
 CORS(app)
 app.secret_key = os.environ.get('FLASK_SECRET', 'dev-secret-key')
 
+# With REDIS_URL set, keep session data (e.g. the discarded list) in Redis so
+# the cookie only carries a session id and all workers share state.
+if os.environ.get('REDIS_URL'):
+    from flask_session import Session
+    import redis
+
+    app.config.update(
+        SESSION_TYPE='redis',
+        SESSION_REDIS=redis.Redis.from_url(os.environ['REDIS_URL']),
+        SESSION_PERMANENT=False,
+    )
+    Session(app)
+
+# Shared HTTP session so upstream Ollama connections are kept alive and
+# reused across requests instead of reconnecting on every chat.
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=32,
+    max_retries=Retry(total=2, backoff_factor=0.1, status_forcelist=[502, 503, 504]),
+)
+_SESSION.mount('http://', _ADAPTER)
+_SESSION.mount('https://', _ADAPTER)
+
+
+# Parsed config.json, keyed on the file's mtime.
+_CFG_CACHE = {'mtime': -1, 'cfg': {}}
+
 
 def load_config() -> dict:
-    if os.path.exists(CFG_PATH):
-        try:
-            with open(CFG_PATH, 'r') as f:
-                cfg = json.load(f)
-                return cfg
-        except Exception as e:
-            log.exception('Failed to parse config.json')
-            return {}
-    return {}
+    try:
+        mt = os.stat(CFG_PATH).st_mtime_ns
+    except FileNotFoundError:
+        return {}
+    if mt == _CFG_CACHE['mtime']:
+        return _CFG_CACHE['cfg']
+    try:
+        with open(CFG_PATH, 'r') as f:
+            cfg = json.load(f)
+    except Exception as e:
+        log.exception('Failed to parse config.json')
+        cfg = {}
+    _CFG_CACHE['cfg'] = cfg
+    _CFG_CACHE['mtime'] = mt
+    return cfg
+
+
+def resolved_config() -> dict:
+    """Return a copy of the config with OLLAMA_HOST / OLLAMA_MODEL env overrides applied."""
+    cfg = dict(load_config())
+    host = os.environ.get('OLLAMA_HOST')
+    if host:
+        cfg['ollama_host'] = host
+    model = os.environ.get('OLLAMA_MODEL')
+    if model:
+        cfg['ollama_model'] = model
+    return cfg
 
 
 def build_ollama_api_url(cfg: dict) -> str:
@@ -63,7 +135,12 @@ def build_ollama_api_url(cfg: dict) -> str:
       - host:port
       - host (port default 11434)
     """
-    host = (cfg.get('ollama_host') or '').strip()
+    return _build_ollama_api_url_cached(cfg.get('ollama_host') or '')
+
+
+@functools.lru_cache(maxsize=8)
+def _build_ollama_api_url_cached(host: str) -> str:
+    host = host.strip()
     if not host:
         host = 'localhost:11434'
 
@@ -79,60 +156,253 @@ def build_ollama_api_url(cfg: dict) -> str:
     return base + '/api/chat'
 
 
+# Patterns used to clean up model replies, compiled once at import. The tag
+# pattern uses RE2 when installed. The others stay on `re`: RE2's \s and \w
+# are ASCII-only, which would treat e.g. NBSP differently, and the dedup
+# pattern needs a backreference, which RE2 does not support.
+# Longer bracketed/angled spans are left alone, which also bounds how much
+# text the streaming sanitizer holds back while waiting for a tag to close.
+_MAX_TAG_LEN = 256
+_RE_TAGS = re_fast.compile(rf"\[[^\]\n]{{0,{_MAX_TAG_LEN}}}\]|<[^>\n]{{0,{_MAX_TAG_LEN}}}>")
+_RE_QUOTE = re.compile(r"\s*'\s*")
+_RE_SPACE = re.compile(r"\s+([.,!?;:])?")
+_RE_DEDUP = re.compile(r"\b(\w+)(?:\s+\1\b)+", re.I)
+
+
+def _space_repl(m) -> str:
+    # drop whitespace before punctuation, collapse any other run to one space
+    return m.group(1) or ' '
+
+
+def _sanitize_fragment(s: str) -> str:
+    """Apply the reply clean-up patterns without trimming the ends."""
+    return _tidy_fragment(_RE_TAGS.sub('', s))
+
+
+def _tidy_fragment(s: str) -> str:
+    # everything except tag stripping
+    s = _RE_QUOTE.sub("'", s)
+    s = _RE_DEDUP.sub(r"\1", s)
+    return _RE_SPACE.sub(_space_repl, s)
+
+
+_RE_TRAILING_WORD = re.compile(r"\S*$")
+_RE_LAST_WS = re.compile(r"\s+\S*$")
+
+
+class _StreamSanitizer:
+    """Sanitize a reply that arrives in pieces.
+
+    Text is released up to the last whitespace run (and before any tag that
+    is still open), and each release is cleaned together with the last word
+    already sent so duplicate words and punctuation spacing are handled
+    across piece boundaries.
+    """
+
+    def __init__(self) -> None:
+        self.pending = ''
+        self.word = ''
+        self.space = False
+        self.started = False
+
+    def feed(self, piece: str) -> str:
+        self.pending += piece
+        m = _RE_LAST_WS.search(self.pending)
+        cut = m.start() if m else 0
+        # moving the cut back can reopen a tag that closed after the old cut,
+        # so repeat until no tag is left open before it
+        moved = True
+        while moved:
+            moved = False
+            for opener, closer in (('[', ']'), ('<', '>')):
+                # tags never span lines
+                start = max(self.pending.rfind(closer, 0, cut) + 1,
+                            self.pending.rfind('\n', 0, cut) + 1,
+                            cut - _MAX_TAG_LEN - 1)
+                i = self.pending.find(opener, start, cut)
+                if i != -1:
+                    # hold back the word before the tag too; it may continue after it
+                    m = _RE_LAST_WS.search(self.pending, 0, i)
+                    cut = m.start() if m else 0
+                    moved = True
+        return self._release(cut)
+
+    def flush(self) -> str:
+        return self._release(len(self.pending))
+
+    def _release(self, cut: int) -> str:
+        chunk, self.pending = self.pending[:cut], self.pending[cut:]
+        if not chunk:
+            return ''
+        # the carried word is already clean; stripping tags again could join
+        # it with text that was not a tag when it was released
+        res = _tidy_fragment(self.word + (' ' if self.space else '') + _RE_TAGS.sub('', chunk))
+        if not self.started:
+            res = res.lstrip()
+        # trailing whitespace is held back until we know what follows it
+        body = res.rstrip()
+        self.space = len(body) < len(res)
+        delta = body[len(os.path.commonprefix([body, self.word])):]
+        if body:
+            self.word = _RE_TRAILING_WORD.search(body).group(0)
+        if delta:
+            self.started = True
+        return delta
+
+
+def collect_pieces(obj, pieces: list[str]) -> None:
+    """Append any reply text found in an Ollama / OpenAI-style chunk to `pieces`."""
+    if not obj:
+        return
+    if isinstance(obj, dict):
+        msg = obj.get('message') or {}
+        if isinstance(msg, dict):
+            c = msg.get('content')
+            if isinstance(c, str) and c:
+                pieces.append(c)
+        for k in ('content', 'text', 'reply'):
+            v = obj.get(k)
+            if isinstance(v, str) and v:
+                pieces.append(v)
+        chs = obj.get('choices')
+        if isinstance(chs, list):
+            for ch in chs:
+                if isinstance(ch, dict):
+                    cm = (ch.get('message') or {}).get('content')
+                    if isinstance(cm, str) and cm:
+                        pieces.append(cm)
+                    if isinstance(ch.get('text'), str) and ch.get('text'):
+                        pieces.append(ch.get('text'))
+    elif isinstance(obj, list):
+        for item in obj:
+            collect_pieces(item, pieces)
+    elif isinstance(obj, str):
+        pieces.append(obj)
+
+
+def _sanitize(reply: str) -> str:
+    """Clean up a complete model reply: strip [tags] / <tags>, fix spacing
+    around apostrophes and punctuation, drop repeated words."""
+    return _sanitize_fragment(reply).strip()
+
+
 def sanitize_ai_text(s: Optional[str]) -> str:
-    if not s:
-        return ''
-    # strip bracket or angle tags like [start], [end], <tag>
-    s = re.sub(r"\[.*?\]", '', s)
-    s = re.sub(r"<.*?>", '', s)
-    s = re.sub(r"\s+", ' ', s)
-    return s.strip()
+    return _sanitize(s or '')
+
+
+# Parsed people.xml, keyed on the file's mtime so edits are picked up
+# without re-parsing on every request.
+_PEOPLE_CACHE = {'mtime': None, 'data': None, 'by_id': {}, 'user': None, 'prompts': {}}
 
 
 def load_people() -> list[dict]:
-    if not os.path.exists(DATA_FILE):
+    try:
+        st = os.stat(DATA_FILE)
+    except FileNotFoundError:
         return []
+    if st.st_mtime_ns == _PEOPLE_CACHE['mtime']:
+        return _PEOPLE_CACHE['data']
+    # Stream <person> elements and free each one once read, rather than
+    # building the whole document tree in memory.
+    people = []
+    iter_kw = {'tag': 'person'} if _HAS_LXML else {}
     try:
-        tree = ET.parse(DATA_FILE)
+        for _, p in ET.iterparse(DATA_FILE, events=('end',), **iter_kw):
+            if p.tag != 'person':
+                continue
+            person = {
+                'name': p.findtext('name', ''),
+                'age': p.findtext('age', ''),
+                'tagline': p.findtext('tagline', ''),
+                'likes': p.findtext('likes', ''),
+                'description': p.findtext('description', ''),
+            }
+            person['id'] = p.get('id') or str(len(people) + 1)
+            person['images'] = [i.text or '' for i in p.iterfind('image')]
+            sp = p.get('special')
+            if sp:
+                person['special'] = sp
+            people.append(person)
+            p.clear()
+            if _HAS_LXML:
+                # lxml keeps processed siblings attached to the root
+                while p.getprevious() is not None:
+                    del p.getparent()[0]
     except ET.ParseError as e:
         log.exception('Failed to parse XML: %s', e)
         raise
-    root = tree.getroot()
-    people = []
-    for p in root.findall('person'):
-        person = {}
-        # read child tags except image
-        for child in p:
-            if child.tag == 'image':
-                continue
-            person[child.tag] = child.text or ''
-        person['id'] = p.get('id') or person.get('id') or str(len(people) + 1)
-        imgs = [i.text or '' for i in p.findall('image')]
-        person['images'] = imgs
-        if 'special' in p.attrib:
-            person['special'] = p.attrib.get('special')
-        people.append(person)
+    user = next((p for p in people if p.get('special') == 'self'), None)
+    _PEOPLE_CACHE['by_id'] = {p['id']: p for p in people}
+    _PEOPLE_CACHE['user'] = user
+    # prompts only depend on the XML contents, so assemble them all up front
+    _PEOPLE_CACHE['prompts'] = {p['id']: build_system_prompt(p, user) for p in people} if user else {}
+    _PEOPLE_CACHE['data'] = people
+    _PEOPLE_CACHE['mtime'] = st.st_mtime_ns
     return people
 
 
+def get_person(pid: Optional[str]) -> Optional[dict]:
+    """Look up a person by id in the people loaded by `load_people()`."""
+    if not isinstance(pid, str):
+        return None
+    return _PEOPLE_CACHE['by_id'].get(pid)
+
+
+def get_self_user() -> Optional[dict]:
+    """Return the `special="self"` entry loaded by `load_people()`."""
+    return _PEOPLE_CACHE['user']
+
+
+def get_system_prompt(pid: Optional[str]) -> Optional[str]:
+    """Return the prebuilt system prompt for chatting with person `pid`."""
+    return _PEOPLE_CACHE['prompts'].get(pid)
+
+
+def build_system_prompt(person: dict, user: dict) -> str:
+    """Assemble the role-play system prompt for chatting with `person`."""
+    return (
+        f"You are {person.get('name')} (age {person.get('age')}). Tagline: {person.get('tagline')}."
+        f" Likes: {person.get('likes')}. Bio: {person.get('description','')}."
+        f" The user is {user.get('name')} (age {user.get('age')}). User bio: {user.get('description','')}"
+        " Stay in character and answer conversationally."
+    )
+
+
 @app.route('/')
 def index():
     return render_template('index.html')
 
 
+def build_candidates(discarded) -> list[dict]:
+    """Return the non-self people not in `discarded`, before shuffling."""
+    skip = set(discarded)
+    return [p for p in load_people() if p.get('special') != 'self' and p.get('id') not in skip]
+
+
 @app.route('/api/people')
 def api_people():
-    people = load_people()
-    discarded = session.get('discarded', [])
-    candidates = [p for p in people if p.get('special') != 'self' and p.get('id') not in discarded]
+    load_people()
+    mtime = _PEOPLE_CACHE['mtime']
+    disc = tuple(sorted(session.get('discarded', [])))
+    candidates = build_candidates(disc)
     if not candidates:
         # reshuffle
         session['discarded'] = []
-        candidates = [p for p in people if p.get('special') != 'self']
-    import random
-    random.shuffle(candidates)
-    user = next((p for p in people if p.get('special') == 'self'), None)
-    return jsonify({'people': candidates, 'user': user})
+        disc = ()
+        candidates = build_candidates(disc)
+
+    # the candidate set only changes with the XML file or the discard list
+    etag = hashlib.blake2b(f"{mtime}:{','.join(map(str, disc))}".encode(), digest_size=16).hexdigest()
+    if request.if_none_match.contains(etag):
+        resp = Response(status=304)
+    else:
+        import random
+        random.shuffle(candidates)
+        user = get_self_user()
+        resp = jsonify({'people': candidates, 'user': user})
+    resp.set_etag(etag)
+    resp.headers['Cache-Control'] = 'private, must-revalidate'
+    return resp
 
 
 @app.route('/api/discard', methods=['POST'])
@@ -141,21 +411,21 @@ def api_discard():
     pid = body.get('id')
     if not pid:
         return jsonify({'error': 'missing id'}), 400
+    if not isinstance(pid, str):
+        return jsonify({'error': 'invalid id'}), 400
     discarded = session.get('discarded', [])
-    if pid not in discarded:
-        discarded.append(pid)
+    if pid in discarded:
+        # unchanged; skip re-signing the session cookie
+        return jsonify({'status': 'ok', 'discarded': discarded})
+    discarded = discarded + [pid]
     session['discarded'] = discarded
     return jsonify({'status': 'ok', 'discarded': discarded})
 
 
 @app.route('/api/chat', methods=['POST'])
 def api_chat():
-    cfg = load_config()
     # allow environment overrides for host/model
-    if os.environ.get('OLLAMA_HOST'):
-        cfg['ollama_host'] = os.environ.get('OLLAMA_HOST')
-    if os.environ.get('OLLAMA_MODEL'):
-        cfg['ollama_model'] = os.environ.get('OLLAMA_MODEL')
+    cfg = resolved_config()
 
     model = cfg.get('ollama_model')
     if not model:
@@ -167,18 +437,15 @@ def api_chat():
     person_id = body.get('person_id')
     message = body.get('message', '')
 
-    people = load_people()
-    person = next((p for p in people if p.get('id') == person_id), None)
-    user = next((p for p in people if p.get('special') == 'self'), None)
+    load_people()
+    person = get_person(person_id)
+    user = get_self_user()
     if person is None:
         return jsonify({'error': 'person not found'}), 400
+    if user is None:
+        return jsonify({'error': 'server_data_missing_user', 'message': 'Add a <person special="self"> entry to people.xml'}), 500
 
-    system_prompt = (
-        f"You are {person.get('name')} (age {person.get('age')}). Tagline: {person.get('tagline')}."
-        f" Likes: {person.get('likes')}. Bio: {person.get('description','')}."
-        f" The user is {user.get('name')} (age {user.get('age')}). User bio: {user.get('description','')}"
-        " Stay in character and answer conversationally."
-    )
+    system_prompt = get_system_prompt(person['id'])
 
     # Instead of contacting Ollama from the backend, return the assembled
     # system prompt and the user's message to the frontend. The frontend will
@@ -193,113 +460,146 @@ def api_chat():
     })
 
 
+def _sse(obj) -> str:
+    return f"data: {orjson.dumps(obj).decode()}\n\n"
+
+
+def _stream_reply(resp):
+    """Yield server-sent events with sanitized reply text as Ollama produces it."""
+    sanitizer = _StreamSanitizer()
+    try:
+        with resp:
+            for raw in resp.iter_lines():
+                raw = raw.strip()
+                if not raw:
+                    continue
+                pieces: list[str] = []
+                try:
+                    collect_pieces(orjson.loads(raw), pieces)
+                except orjson.JSONDecodeError:
+                    pieces.append(raw.decode('utf-8', 'replace'))
+                delta = sanitizer.feed(''.join(pieces))
+                if delta:
+                    yield _sse({'delta': delta})
+    except requests.RequestException as e:
+        log.exception('Proxy failed reading Ollama stream')
+        yield _sse({'error': 'connection_failed', 'detail': str(e)})
+        return
+    delta = sanitizer.flush()
+    if delta:
+        yield _sse({'delta': delta})
+    yield _sse({'done': True})
+
+
+# Limits on what /api/proxy_chat forwards upstream.
+_MAX_TURNS = 32
+_MAX_MSG_CHARS = 8192
+# the frontend sends at most three: style rules, memory summary, persona
+_MAX_SYSTEM_MSGS = 3
+
+
 @app.route('/api/proxy_chat', methods=['POST'])
 def api_proxy_chat():
     """Proxy a chat request to the configured Ollama server and return a
     sanitized assistant reply.
     Expected POST body: { model?: str, messages: [{role,content}, ...] }
     If `model` is missing in the request body, the server config's model is used.
+    With `?stream=1` the reply is sent as server-sent events
+    (`{delta}` chunks, then `{done: true}`) as Ollama generates it.
     """
-    cfg = load_config()
-    if os.environ.get('OLLAMA_HOST'):
-        cfg['ollama_host'] = os.environ.get('OLLAMA_HOST')
-    if os.environ.get('OLLAMA_MODEL'):
-        cfg['ollama_model'] = os.environ.get('OLLAMA_MODEL')
+    cfg = resolved_config()
 
     body = request.get_json(silent=True) or {}
     req_model = body.get('model') or cfg.get('ollama_model')
     messages = body.get('messages') or []
 
-    if not messages:
+    if not messages or not isinstance(messages, list):
         return jsonify({'error': 'missing_messages'}), 400
 
+    # bound what gets forwarded: keep the leading system messages (memory
+    # summary, persona prompt) and the newest turns, and cut overly long
+    # message contents
+    if len(messages) > _MAX_TURNS:
+        n_sys = 0
+        while n_sys < len(messages) and isinstance(messages[n_sys], dict) \
+                and messages[n_sys].get('role') == 'system':
+            n_sys += 1
+        head = messages[:min(n_sys, _MAX_SYSTEM_MSGS)]
+        messages = head + messages[n_sys:][-(_MAX_TURNS - len(head)):]
+    for m in messages:
+        if isinstance(m, dict):
+            c = m.get('content')
+            if isinstance(c, str) and len(c) > _MAX_MSG_CHARS:
+                m['content'] = c[:_MAX_MSG_CHARS]
+
     ollama_url = build_ollama_api_url(cfg)
     # Prepare payload to Ollama
     payload = {'model': req_model, 'messages': messages}
     headers = {'Content-Type': 'application/json', 'Ollama-Model': req_model or ''}
 
+    streaming = request.args.get('stream') == '1'
+    if streaming:
+        payload['stream'] = True
+
     try:
-        resp = requests.post(ollama_url, json=payload, headers=headers, timeout=60)
+        resp = _SESSION.post(ollama_url, json=payload, headers=headers, timeout=(3.05, 60), stream=True)
     except requests.RequestException as e:
         log.exception('Proxy failed contacting Ollama')
         return jsonify({'error': 'connection_failed', 'detail': str(e)}), 502
 
     status = resp.status_code
-    text_body = resp.text or ''
     log.info('Proxy Ollama status=%s', status)
 
+    if streaming and status < 400:
+        return Response(stream_with_context(_stream_reply(resp)), mimetype='text/event-stream')
+
     # collect pieces from JSON / NDJSON streaming lines
     pieces: list[str] = []
 
-    def collect_from_obj(obj):
-        if not obj:
-            return
-        if isinstance(obj, dict):
-            msg = obj.get('message') or {}
-            if isinstance(msg, dict):
-                c = msg.get('content')
-                if isinstance(c, str) and c:
-                    pieces.append(c)
-            for k in ('content', 'text', 'reply'):
-                v = obj.get(k)
-                if isinstance(v, str) and v:
-                    pieces.append(v)
-            chs = obj.get('choices')
-            if isinstance(chs, list):
-                for ch in chs:
-                    if isinstance(ch, dict):
-                        cm = (ch.get('message') or {}).get('content')
-                        if isinstance(cm, str) and cm:
-                            pieces.append(cm)
-                        if isinstance(ch.get('text'), str) and ch.get('text'):
-                            pieces.append(ch.get('text'))
-        elif isinstance(obj, str):
-            pieces.append(obj)
-
-    # Try standard JSON first
+    # Single pass over the (possibly NDJSON) body: each line is decoded and
+    # collected as it arrives instead of buffering and re-parsing the text.
+    lines: list[bytes] = []
+    unparsed_any = False
     try:
-        jr = resp.json()
-    except Exception:
-        jr = None
-
-    if jr:
-        if isinstance(jr, list):
-            for item in jr:
-                collect_from_obj(item)
-        else:
-            collect_from_obj(jr)
-
-    if not pieces and text_body:
-        for line in text_body.splitlines():
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                obj = json.loads(line)
-            except Exception:
+        with resp:
+            for raw in resp.iter_lines():
+                raw = raw.strip()
+                if not raw:
+                    continue
+                lines.append(raw)
                 try:
-                    decoder = json.JSONDecoder()
-                    obj, _ = decoder.raw_decode(line)
-                except Exception:
+                    obj = orjson.loads(raw)
+                except orjson.JSONDecodeError:
                     # not JSON
-                    pieces.append(line)
+                    unparsed_any = True
+                    pieces.append(raw.decode('utf-8', 'replace'))
                     continue
-            collect_from_obj(obj)
+                collect_pieces(obj, pieces)
+    except requests.RequestException as e:
+        log.exception('Proxy failed reading Ollama response')
+        return jsonify({'error': 'connection_failed', 'detail': str(e)}), 502
+
+    body_bytes = b'\n'.join(lines)
+    text_body = body_bytes.decode('utf-8', 'replace')
+    if unparsed_any and len(lines) > 1:
+        # possibly a single JSON document spread over several lines; prefer
+        # it over the per-line pieces when it parses
+        try:
+            jr = orjson.loads(body_bytes)
+        except orjson.JSONDecodeError:
+            jr = None
+        if jr:
+            doc_pieces: list[str] = []
+            collect_pieces(jr, doc_pieces)
+            if doc_pieces:
+                pieces = doc_pieces
 
     if pieces:
         reply_text = ''.join(pieces).strip()
     else:
         reply_text = text_body.strip()
 
-    # sanitize
-    s = re.sub(r"\[.*?\]", '', reply_text)
-    s = re.sub(r"<.*?>", '', s)
-    s = re.sub(r"\s+'\s+", "'", s)
-    s = re.sub(r"\s+'", "'", s)
-    s = re.sub(r"'\s+", "'", s)
-    s = re.sub(r"\b(\w+)(?:\s+\1\b)+", r"\1", s, flags=re.I)
-    s = re.sub(r"\s+([.,!?;:])", r"\1", s)
-    s = re.sub(r"\s+", ' ', s).strip()
+    s = _sanitize(reply_text)
 
     if not s:
         return jsonify({'error': 'no_reply_extracted', 'status': status, 'body': text_body[:2000]}), 502
@@ -307,7 +607,27 @@ def api_proxy_chat():
     return jsonify({'reply': s}), 200
 
 
+def warm_caches() -> None:
+    """Load config and people and open a pooled connection to Ollama, so the
+    first request doesn't pay for them."""
+    load_people()
+    url = build_ollama_api_url(resolved_config()).replace('/api/chat', '/')
+    # go through the session so the connection lands in the pool that chat
+    # requests use, but without retries so startup doesn't stall when Ollama
+    # is down
+    retries, _ADAPTER.max_retries = _ADAPTER.max_retries, Retry(0, read=False)
+    try:
+        _SESSION.get(url, timeout=1.0)
+    except requests.RequestException as e:
+        log.info('Could not pre-connect to Ollama at %s: %s', url, e)
+    finally:
+        _ADAPTER.max_retries = retries
+
+
 if __name__ == '__main__':
+    warm_caches()
     cfg = load_config()
     log.info('Starting Flask app; Ollama host from config: %s', cfg.get('ollama_host'))
-    app.run(host='0.0.0.0', port=int(os.environ.get('PORT', 5001)), debug=True)
+    # Development server only; use `gunicorn -c gunicorn.conf.py app:app` otherwise.
+    app.run(host='0.0.0.0', port=int(os.environ.get('PORT', 5001)),
+            debug=os.environ.get('FLASK_ENV') == 'development')
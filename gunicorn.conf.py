@@ -0,0 +1,22 @@
+"""Gunicorn settings for serving `app:app`.
+
+Run with: gunicorn -c gunicorn.conf.py app:app
+
+gevent workers let one process keep many chats open while they wait on
+the Ollama server; gunicorn monkey-patches the worker before the app is
+imported, so `requests` calls become cooperative.
+"""
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 5001)}"
+workers = 2 * multiprocessing.cpu_count() + 1
+worker_class = 'gevent'
+worker_connections = 1000
+keepalive = 30
+
+
+def post_worker_init(worker):
+    # caches and the Ollama connection pool are per process
+    from app import warm_caches
+    warm_caches()
@@ -0,0 +1,62 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+
+class _OllamaHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+
+    def _reply(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        data = self.rfile.read(length)
+        if data:
+            self.server.requests.append(json.loads(data))
+        body = b'{"message": {"content": "hi"}}\n'
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = _reply
+    do_POST = _reply
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def ollama(monkeypatch):
+    """A local stand-in for the Ollama server; records posted JSON bodies."""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _OllamaHandler)
+    server.connections = 0
+    server.requests = []
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setenv('OLLAMA_HOST', f'127.0.0.1:{server.server_port}')
+    monkeypatch.setenv('OLLAMA_MODEL', 'test-model')
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def client():
+    import app
+    return app.app.test_client()
+
+
+@pytest.fixture
+def people(monkeypatch):
+    """Point the app at the bundled sample profiles."""
+    import os
+    import app
+    monkeypatch.setattr(app, 'DATA_FILE', os.path.join(app.BASE_DIR, 'data', 'profiles.xml'))
+    app._PEOPLE_CACHE['mtime'] = None
+    app.load_people()
+    yield app._PEOPLE_CACHE['data']
+    app._PEOPLE_CACHE['mtime'] = None
@@ -0,0 +1,28 @@
+import pytest
+
+
+@pytest.mark.parametrize('person_id', [[], {}, 1, None, 'nobody'])
+def test_unknown_person_is_400(people, client, person_id):
+    resp = client.post('/api/chat', json={'person_id': person_id, 'message': 'hi'})
+    assert resp.status_code == 400
+    assert resp.get_json() == {'error': 'person not found'}
+
+
+def test_known_person_gets_prompt(people, client):
+    resp = client.post('/api/chat', json={'person_id': 'p1', 'message': 'hi'})
+    assert resp.status_code == 200
+    assert resp.get_json()['system_prompt'].startswith('You are Alice')
+
+
+def test_missing_self_entry_is_an_error(monkeypatch, client, tmp_path):
+    import app
+    xml = tmp_path / 'people.xml'
+    xml.write_text('<people><person id="p1"><name>Alice</name></person></people>')
+    monkeypatch.setattr(app, 'DATA_FILE', str(xml))
+    app._PEOPLE_CACHE['mtime'] = None
+    try:
+        resp = client.post('/api/chat', json={'person_id': 'p1', 'message': 'hi'})
+    finally:
+        app._PEOPLE_CACHE['mtime'] = None
+    assert resp.status_code == 500
+    assert resp.get_json()['error'] == 'server_data_missing_user'
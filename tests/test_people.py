@@ -0,0 +1,19 @@
+def test_people_excludes_self_and_discarded(people, client):
+    assert client.post('/api/discard', json={'id': 'p1'}).status_code == 200
+    data = client.get('/api/people').get_json()
+    assert [p['id'] for p in data['people']] == ['p2']
+    assert data['user']['id'] == 'user'
+
+
+def test_discard_rejects_non_string_id(people, client):
+    assert client.post('/api/discard', json={'id': 1}).status_code == 400
+    assert client.get('/api/people').status_code == 200
+
+
+def test_people_etag_round_trip(people, client):
+    first = client.get('/api/people')
+    etag = first.headers['ETag']
+    again = client.get('/api/people', headers={'If-None-Match': etag})
+    assert again.status_code == 304
+    client.post('/api/discard', json={'id': 'p1'})
+    assert client.get('/api/people', headers={'If-None-Match': etag}).status_code == 200
@@ -0,0 +1,21 @@
+import app
+
+
+def test_trims_turns_but_keeps_frontend_system_messages(ollama, client):
+    system = [{'role': 'system', 'content': f's{i}'} for i in range(3)]
+    turns = [{'role': 'user', 'content': f'u{i}'} for i in range(100)]
+    resp = client.post('/api/proxy_chat', json={'messages': system + turns})
+    assert resp.status_code == 200
+    sent = ollama.requests[-1]['messages']
+    assert len(sent) == app._MAX_TURNS
+    assert sent[:3] == system
+    assert sent[-1] == turns[-1]
+
+
+def test_leading_system_messages_cannot_bypass_cap(ollama, client):
+    system = [{'role': 'system', 'content': 's'}] * 10000
+    resp = client.post('/api/proxy_chat', json={'messages': system + [{'role': 'user', 'content': 'hi'}]})
+    assert resp.status_code == 200
+    sent = ollama.requests[-1]['messages']
+    assert len(sent) <= app._MAX_TURNS
+    assert sent[-1] == {'role': 'user', 'content': 'hi'}
@@ -0,0 +1,58 @@
+import random
+
+import pytest
+
+from app import _MAX_TAG_LEN, _StreamSanitizer, _sanitize
+
+
+def stream(pieces):
+    sanitizer = _StreamSanitizer()
+    out = ''.join(sanitizer.feed(p) for p in pieces)
+    return out + sanitizer.flush()
+
+
+def splits(text, rng, n=50):
+    """Yield `n` random ways of cutting `text` into pieces, plus per-char."""
+    yield list(text)
+    yield [text]
+    for _ in range(n):
+        cuts = sorted(rng.sample(range(len(text) + 1), min(len(text) + 1, rng.randint(0, 8))))
+        yield [text[i:j] for i, j in zip([0] + cuts, cuts + [len(text)])]
+
+
+@pytest.mark.parametrize('text', [
+    "Hey [winks <3] there",
+    "Hello  [start] there there , I 'm <b>fine</b> ! The the cat said : don 't worry [end]  ok ok.",
+    "<\n.>,the  ",
+    "a a< >bb",
+    "I love you <3 so so much!",
+    "",
+    "Hi <" + "a " * 200 + "> there",
+    "Hi <" + "a" * _MAX_TAG_LEN + "> there",
+    "Hi [" + "b" * (_MAX_TAG_LEN + 1) + "] there",
+])
+def test_stream_matches_full_sanitize(text):
+    rng = random.Random(0)
+    expected = _sanitize(text)
+    for pieces in splits(text, rng):
+        assert stream(pieces) == expected, pieces
+
+
+def test_stream_matches_full_sanitize_fuzz():
+    rng = random.Random(1)
+    alphabet = "ab The '.,[]<>\n"
+    for _ in range(2000):
+        text = ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 30)))
+        expected = _sanitize(text)
+        for pieces in splits(text, rng, n=3):
+            assert stream(pieces) == expected, pieces
+
+
+def test_stream_matches_full_sanitize_long_spans():
+    rng = random.Random(2)
+    tokens = ['a', 'the', ' ', '  ', '\n', '<', '>', '[', ']', ',', 'x' * 120, 'y ' * 70]
+    for _ in range(300):
+        text = ''.join(rng.choice(tokens) for _ in range(rng.randint(0, 15)))
+        expected = _sanitize(text)
+        for pieces in splits(text, rng, n=3):
+            assert stream(pieces) == expected, pieces
@@ -0,0 +1,16 @@
+import app
+
+
+def test_warm_connection_is_reused_by_chat_requests(ollama):
+    app.warm_caches()
+    assert ollama.connections == 1
+    url = app.build_ollama_api_url(app.resolved_config())
+    app._SESSION.post(url, json={'model': 'm', 'messages': []}, timeout=(3.05, 60)).close()
+    assert ollama.connections == 1
+
+
+def test_warm_caches_does_not_retry(monkeypatch):
+    monkeypatch.setenv('OLLAMA_HOST', '127.0.0.1:1')
+    before = app._ADAPTER.max_retries
+    app.warm_caches()
+    assert app._ADAPTER.max_retries is before